@@ -8,6 +8,7 @@ from flask_cors import CORS
 from skillforge import SkillForgeManager, TechnicalSkill, SoftSkill, MasteryAlgorithm
 from db_sqlite import Database
 import os
+import atexit
 
 app = Flask(__name__, static_folder='static', static_url_path='')
 
@@ -23,6 +24,7 @@ CORS(app, resources={
 # Initialize database and manager
 db = Database()
 manager = SkillForgeManager('skillforge_data.json')
+atexit.register(manager.force_flush)  # Writes are batched via maybe_flush()
 
 @app.route('/')
 def index():
@@ -68,7 +70,7 @@ def get_skills():
             # Fallback to JSON file
             skills_data = []
             for skill in manager._SkillForgeManager__skills:
-                skill_dict = skill.to_dict()
+                skill_dict = dict(skill.to_dict())  # Copy - to_dict() is cached
                 skill_dict['mastery_score'] = skill.calculate_mastery_score()
                 skill_dict['mastery_level'] = MasteryAlgorithm.get_mastery_level(
                     skill_dict['mastery_score']
@@ -116,7 +118,7 @@ def add_skill():
                 db.add_skill(skill_data)
             else:
                 manager.add_technical_skill(name, category, difficulty)
-                manager.save_skills()
+                manager.maybe_flush()
         elif skill_type == 'soft':
             applications = int(data.get('applications', 0))
             skill_data['real_world_applications'] = applications
@@ -127,7 +129,7 @@ def add_skill():
                 db.add_skill(skill_data)
             else:
                 manager.add_soft_skill(name, category, applications)
-                manager.save_skills()
+                manager.maybe_flush()
         else:
             return jsonify({
                 'success': False,
@@ -166,7 +168,7 @@ def update_progress(skill_name):
                 }), 404
         else:
             manager.update_skill_progress(skill_name, progress)
-            manager.save_skills()
+            manager.maybe_flush()
         
         return jsonify({
             'success': True,
@@ -200,7 +202,7 @@ def log_hours(skill_name):
                 }), 404
         else:
             manager.log_practice_hours(skill_name, hours)
-            manager.save_skills()
+            manager.maybe_flush()
         
         return jsonify({
             'success': True,
@@ -231,7 +233,7 @@ def add_application(skill_name):
                 }), 404
         else:
             manager.add_soft_skill_application(skill_name)
-            manager.save_skills()
+            manager.maybe_flush()
         
         return jsonify({
             'success': True,
@@ -334,8 +336,8 @@ def get_statistics():
                 })
             
             total_skills = len(skills)
-            tech_skills = sum(1 for s in skills if isinstance(s, TechnicalSkill))
-            soft_skills = sum(1 for s in skills if isinstance(s, SoftSkill))
+            tech_skills = sum(1 for s in skills if type(s) is TechnicalSkill)
+            soft_skills = sum(1 for s in skills if type(s) is SoftSkill)
             avg_mastery = sum(s.calculate_mastery_score() for s in skills) / total_skills
             total_hours = sum(s.practice_hours for s in skills)
         
@@ -7,9 +7,48 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 import json
 import os
+import sys
 import math
+import time
+import atexit
+import threading
 from typing import List, Dict, Optional, Any
 
+try:
+    import orjson  # Fast native JSON (optional)
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Streaming JSON parser for large storage files (optional)
+except ImportError:
+    ijson = None
+
+import skillforge_math
+
+# Hybrid mastery formulas - native build when current, otherwise pure Python
+tech_mastery, soft_mastery = skillforge_math.load_formulas()
+
+
+# ============================================================================
+# TIMESTAMP HELPERS
+# ============================================================================
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# [epoch_second, formatted_string] - reused while the wall-clock second is unchanged
+_ts_cache = [0, ""]
+
+
+def _now_str() -> str:
+    """Return the current local time formatted with TIMESTAMP_FORMAT (cached per second)"""
+    t = int(time.time())
+    c = _ts_cache
+    if c[0] != t:
+        c[0] = t
+        c[1] = datetime.fromtimestamp(t).strftime(TIMESTAMP_FORMAT)
+    return c[1]
+
 
 # ============================================================================
 # MASTERY SCORING ALGORITHMS
@@ -69,7 +108,7 @@ class MasteryAlgorithm:
         Formula: (Progress × 0.4) + (Hours × 0.3) + (Additional × factor_weight)
         """
         progress_component = progress * 0.4
-        practice_component = min((practice_hours / 100) * 100, 100) * 0.3
+        practice_component = min(practice_hours, 100.0) * 0.3
         additional_component = additional_factor * factor_weight
         
         score = progress_component + practice_component + additional_component
@@ -83,7 +122,7 @@ class MasteryAlgorithm:
         
         Formula: Base_Score × (1 + Difficulty_Bonus) where bonus scales with difficulty
         """
-        base_score = (progress * 0.5) + (min(practice_hours / 100, 1.0) * 100 * 0.3)
+        base_score = (progress * 0.5) + (min(practice_hours, 100.0) * 0.3)
         difficulty_bonus = (difficulty / max_difficulty) * 0.2
         
         score = base_score * (1 + difficulty_bonus)
@@ -98,7 +137,7 @@ class MasteryAlgorithm:
         Formula: Emphasizes real-world applications over theory
         """
         progress_component = progress * 0.35
-        practice_component = min((practice_hours / 50) * 100, 100) * 0.25
+        practice_component = min(practice_hours * 2.0, 100.0) * 0.25
         application_component = min((applications / app_cap) * 100, 100) * 0.4
         
         score = progress_component + practice_component + application_component
@@ -112,7 +151,7 @@ class MasteryAlgorithm:
         
         Formula: Base_Score × e^(-decay_rate × days_inactive)
         """
-        base_score = (progress * 0.6) + (min(practice_hours / 100, 1.0) * 100 * 0.4)
+        base_score = (progress * 0.6) + (min(practice_hours, 100.0) * 0.4)
         decay_factor = math.exp(-decay_rate * days_since_update)
         
         return base_score * decay_factor
@@ -152,14 +191,20 @@ class SkillBase(ABC):
     Demonstrates: Abstraction, Encapsulation
     """
     
+    # Fixed attribute layout - no per-instance __dict__ (private names are mangled)
+    __slots__ = ('__name', '__category', '_progress', '_practice_hours', '_created_at',
+                 '_last_updated', '_history', '_mastery_cache', '_dict_cache')
+    
     def __init__(self, name: str, category: str):
         self.__name = name  # Private attribute - Encapsulation
         self.__category = category
         self._progress = 0.0  # Protected attribute
         self._practice_hours = 0.0
-        self._created_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._created_at = _now_str()
         self._last_updated = self._created_at
         self._history: List[Dict[str, Any]] = []  # History tracking
+        self._mastery_cache: Optional[float] = None  # Memoized mastery score
+        self._dict_cache: Optional[Dict] = None  # Memoized to_dict() result
         
         # Log initial creation
         self._add_history_entry("created", "Skill created", {
@@ -167,6 +212,27 @@ class SkillBase(ABC):
             'initial_hours': 0.0
         })
     
+    @classmethod
+    def _from_dict(cls, data: Dict) -> 'SkillBase':
+        """
+        Rebuild a skill from to_dict() output (protected method).
+        Bypasses __init__ so no creation timestamps or history entries are generated.
+        """
+        skill = object.__new__(cls)
+        skill.__name = data['name']
+        category = data['category']
+        if isinstance(category, str):
+            category = sys.intern(category)  # Share repeated category strings
+        skill.__category = category
+        skill._progress = data['progress']
+        skill._practice_hours = data['practice_hours']
+        skill._created_at = data['created_at']
+        skill._last_updated = data['last_updated']
+        skill._history = data.get('history', [])  # Load history if available
+        skill._mastery_cache = None
+        skill._dict_cache = None
+        return skill
+    
     # Getters - Encapsulation
     @property
     def name(self) -> str:
@@ -191,8 +257,8 @@ class SkillBase(ABC):
     
     # Abstract methods - must be implemented by child classes
     @abstractmethod
-    def calculate_mastery_score(self) -> float:
-        """Calculate mastery score based on skill type"""
+    def _compute_mastery_score(self) -> float:
+        """Compute mastery score based on skill type"""
         pass
     
     @abstractmethod
@@ -200,16 +266,28 @@ class SkillBase(ABC):
         """Return the type of skill"""
         pass
     
+    def calculate_mastery_score(self) -> float:
+        """Return mastery score, recomputing only after the skill has changed"""
+        if self._mastery_cache is None:
+            self._mastery_cache = self._compute_mastery_score()
+        return self._mastery_cache
+    
+    def _invalidate_cache(self) -> None:
+        """Drop memoized values after a state change (protected method)"""
+        self._mastery_cache = None
+        self._dict_cache = None
+    
     def update_progress(self, progress: float) -> None:
         """Update skill progress with validation"""
-        if not 0 <= progress <= 100:
+        if not math.isfinite(progress) or not 0 <= progress <= 100:
             raise ValueError("Progress must be between 0 and 100")
         
         old_progress = self._progress
         old_mastery = self.calculate_mastery_score()
         
         self._progress = progress
-        self._last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._invalidate_cache()
+        self._last_updated = _now_str()
         
         new_mastery = self.calculate_mastery_score()
         
@@ -225,6 +303,8 @@ class SkillBase(ABC):
     
     def log_practice_hours(self, hours: float) -> None:
         """Log practice hours with validation"""
+        if not math.isfinite(hours):
+            raise ValueError("Practice hours must be a finite number")
         if hours < 0:
             raise ValueError("Practice hours cannot be negative")
         
@@ -232,7 +312,8 @@ class SkillBase(ABC):
         old_mastery = self.calculate_mastery_score()
         
         self._practice_hours += hours
-        self._last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._invalidate_cache()
+        self._last_updated = _now_str()
         
         new_mastery = self.calculate_mastery_score()
         
@@ -247,84 +328,100 @@ class SkillBase(ABC):
         })
     
     def to_dict(self) -> Dict:
-        """Convert skill object to dictionary for serialization"""
-        return {
-            'name': self.__name,
-            'category': self.__category,
-            'progress': self._progress,
-            'practice_hours': self._practice_hours,
-            'created_at': self._created_at,
-            'last_updated': self._last_updated,
-            'skill_type': self.get_skill_type(),
-            'history': self._history
-        }
+        """
+        Convert skill object to dictionary for serialization.
+        The dict is cached until the skill changes - copy it before modifying.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+    
+    @abstractmethod
+    def _build_dict(self) -> Dict:
+        """Build the full serialization dictionary in one literal (protected method)"""
+        pass
     
     def _add_history_entry(self, action: str, description: str, details: Dict[str, Any]) -> None:
         """Add an entry to skill history (protected method)"""
         entry = {
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'timestamp': _now_str(),
             'action': action,
             'description': description,
             'details': details
         }
         self._history.append(entry)
     
+    @abstractmethod
+    def _display_extra(self) -> Any:
+        """Return the type-specific value shown on the last line of __str__"""
+        pass
+    
     def __str__(self) -> str:
-        """String representation of skill"""
+        """String representation of skill, rendered from the class _STR_FMT template"""
         mastery = self.calculate_mastery_score()
-        mastery_level = MasteryAlgorithm.get_mastery_level(mastery)
-        progress_bar = MasteryAlgorithm.get_progress_bar(mastery)
-        
-        return (f"{self.get_skill_type()}: {self.__name}\n"
-                f"  Category: {self.__category}\n"
-                f"  Progress: {self._progress}%\n"
-                f"  Practice Hours: {self._practice_hours}h\n"
-                f"  Mastery Score: {mastery:.2f}/100 - {mastery_level}\n"
-                f"  Mastery Bar: {progress_bar}\n"
-                f"  Last Updated: {self._last_updated}")
+        return self._STR_FMT.format_map({
+            'skill_type': self._SKILL_TYPE,
+            'name': self.__name,
+            'category': self.__category,
+            'progress': self._progress,
+            'hours': self._practice_hours,
+            'mastery': mastery,
+            'level': MasteryAlgorithm.get_mastery_level(mastery),
+            'bar': MasteryAlgorithm.get_progress_bar(mastery),
+            'updated': self._last_updated,
+            'extra': self._display_extra()
+        })
 
 
 # ============================================================================
 # CONCRETE CLASSES - Inheritance & Polymorphism 
 # ============================================================================
 
+# Display templates (SkillBase.__str__) - one format call per skill
+_SKILL_FMT = ("{skill_type}: {name}\n"
+              "  Category: {category}\n"
+              "  Progress: {progress}%\n"
+              "  Practice Hours: {hours}h\n"
+              "  Mastery Score: {mastery:.2f}/100 - {level}\n"
+              "  Mastery Bar: {bar}\n"
+              "  Last Updated: {updated}")
+_TECH_FMT = _SKILL_FMT + "\n  Difficulty Level: {extra}/10"
+_SOFT_FMT = _SKILL_FMT + "\n  Real-World Applications: {extra}"
+
+
 class TechnicalSkill(SkillBase):
     """
     Technical skill implementation with specific mastery calculation.
     Demonstrates: Inheritance, Polymorphism (method overriding)
     """
     
+    __slots__ = ('__difficulty_level',)
+    
+    _SKILL_TYPE = "Technical Skill"
+    _STR_FMT = _TECH_FMT
+    
     def __init__(self, name: str, category: str, difficulty_level: int = 5):
         super().__init__(name, category)
         self.__difficulty_level = min(max(difficulty_level, 1), 10)  # 1-10 scale
     
-    def calculate_mastery_score(self) -> float:
+    @classmethod
+    def _from_dict(cls, data: Dict) -> 'TechnicalSkill':
+        skill = super()._from_dict(data)
+        skill.__difficulty_level = min(max(data.get('difficulty_level', 5), 1), 10)
+        return skill
+    
+    def _compute_mastery_score(self) -> float:
         """
         Technical skills mastery formula:
         Uses difficulty-adjusted algorithm with exponential growth component
+        (see skillforge_math.tech_mastery)
         """
-        # Primary algorithm: Difficulty-adjusted
-        primary_score = MasteryAlgorithm.difficulty_adjusted(
-            self._progress,
-            self._practice_hours,
-            self.__difficulty_level
-        )
-        
-        # Secondary algorithm: Exponential growth for practice rewards
-        growth_bonus = MasteryAlgorithm.exponential_growth(
-            self._progress,
-            self._practice_hours,
-            base_multiplier=0.15
-        )
-        
-        # Combine both algorithms
-        final_score = (primary_score * 0.85) + (growth_bonus * 0.15)
-        return min(final_score, 100.0)
+        return tech_mastery(self._progress, self._practice_hours, self.__difficulty_level)
     
     def get_mastery_breakdown(self) -> Dict[str, float]:
         """Get detailed breakdown of mastery score components"""
-        difficulty_bonus = (self.__difficulty_level / 10) * 100
-        practice_factor = min((self._practice_hours / 100) * 100, 100)
+        difficulty_bonus = self.__difficulty_level * 10.0
+        practice_factor = min(self._practice_hours, 100.0)
         
         return {
             'progress_contribution': self._progress * 0.5,
@@ -334,16 +431,25 @@ class TechnicalSkill(SkillBase):
         }
     
     def get_skill_type(self) -> str:
-        return "Technical Skill"
+        return self._SKILL_TYPE
     
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data['difficulty_level'] = self.__difficulty_level
-        return data
+    def _build_dict(self) -> Dict:
+        # Single literal with the base fields inlined - avoids building and
+        # extending a second dict via super()
+        return {
+            'name': self._SkillBase__name,
+            'category': self._SkillBase__category,
+            'progress': self._progress,
+            'practice_hours': self._practice_hours,
+            'created_at': self._created_at,
+            'last_updated': self._last_updated,
+            'skill_type': self._SKILL_TYPE,
+            'history': self._history,
+            'difficulty_level': self.__difficulty_level
+        }
     
-    def __str__(self) -> str:
-        base_str = super().__str__()
-        return f"{base_str}\n  Difficulty Level: {self.__difficulty_level}/10"
+    def _display_extra(self) -> int:
+        return self.__difficulty_level
 
 
 class SoftSkill(SkillBase):
@@ -352,37 +458,33 @@ class SoftSkill(SkillBase):
     Demonstrates: Inheritance, Polymorphism (method overriding)
     """
     
+    __slots__ = ('__real_world_applications',)
+    
+    _SKILL_TYPE = "Soft Skill"
+    _STR_FMT = _SOFT_FMT
+    
     def __init__(self, name: str, category: str, real_world_applications: int = 0):
         super().__init__(name, category)
         self.__real_world_applications = max(real_world_applications, 0)
     
-    def calculate_mastery_score(self) -> float:
+    @classmethod
+    def _from_dict(cls, data: Dict) -> 'SoftSkill':
+        skill = super()._from_dict(data)
+        skill.__real_world_applications = max(data.get('real_world_applications', 0), 0)
+        return skill
+    
+    def _compute_mastery_score(self) -> float:
         """
         Soft skills mastery formula:
         Uses application-focused algorithm with balanced composite
+        (see skillforge_math.soft_mastery)
         """
-        # Primary algorithm: Application-focused
-        primary_score = MasteryAlgorithm.application_focused(
-            self._progress,
-            self._practice_hours,
-            self.__real_world_applications
-        )
-        
-        # Secondary algorithm: Sigmoid curve for realistic learning
-        sigmoid_score = MasteryAlgorithm.sigmoid_curve(
-            self._progress,
-            self._practice_hours,
-            steepness=0.08
-        )
-        
-        # Combine both algorithms
-        final_score = (primary_score * 0.75) + (sigmoid_score * 0.25)
-        return min(final_score, 100.0)
+        return soft_mastery(self._progress, self._practice_hours, self.__real_world_applications)
     
     def get_mastery_breakdown(self) -> Dict[str, float]:
         """Get detailed breakdown of mastery score components"""
-        practice_factor = min((self._practice_hours / 50) * 100, 100)
-        application_factor = min((self.__real_world_applications / 20) * 100, 100)
+        practice_factor = min(self._practice_hours * 2.0, 100.0)
+        application_factor = min(self.__real_world_applications * 5.0, 100.0)
         
         return {
             'progress_contribution': self._progress * 0.4,
@@ -392,7 +494,7 @@ class SoftSkill(SkillBase):
         }
     
     def get_skill_type(self) -> str:
-        return "Soft Skill"
+        return self._SKILL_TYPE
     
     def add_real_world_application(self) -> None:
         """Increment real-world application count"""
@@ -400,7 +502,8 @@ class SoftSkill(SkillBase):
         old_mastery = self.calculate_mastery_score()
         
         self.__real_world_applications += 1
-        self._last_updated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._invalidate_cache()
+        self._last_updated = _now_str()
         
         new_mastery = self.calculate_mastery_score()
         
@@ -413,14 +516,21 @@ class SoftSkill(SkillBase):
             'mastery_change': round(new_mastery - old_mastery, 2)
         })
     
-    def to_dict(self) -> Dict:
-        data = super().to_dict()
-        data['real_world_applications'] = self.__real_world_applications
-        return data
+    def _build_dict(self) -> Dict:
+        return {
+            'name': self._SkillBase__name,
+            'category': self._SkillBase__category,
+            'progress': self._progress,
+            'practice_hours': self._practice_hours,
+            'created_at': self._created_at,
+            'last_updated': self._last_updated,
+            'skill_type': self._SKILL_TYPE,
+            'history': self._history,
+            'real_world_applications': self.__real_world_applications
+        }
     
-    def __str__(self) -> str:
-        base_str = super().__str__()
-        return f"{base_str}\n  Real-World Applications: {self.__real_world_applications}"
+    def _display_extra(self) -> int:
+        return self.__real_world_applications
 
 
 # ============================================================================
@@ -433,9 +543,20 @@ class SkillForgeManager:
     Demonstrates: Composition, Exception Handling, File Handling
     """
     
+    # Storage files larger than this are parsed incrementally when ijson is available
+    STREAM_LOAD_MIN_BYTES = 256 * 1024
+    
     def __init__(self, storage_file: str = "skillforge_data.txt"):
         self.__skills: List[SkillBase] = []  # Composition - contains skill objects
+        self.__index: Dict[str, SkillBase] = {}  # Lowercased name -> skill lookup
+        self.__name_cache: Optional[List[str]] = None  # Memoized list_skill_names()
         self.__storage_file = storage_file
+        self.__dirty = False  # Unsaved changes pending
+        self.__last_flush = 0.0  # time.monotonic() of the last successful save
+        self.__flush_lock = threading.RLock()  # Serializes saves with the flush timer
+        self.__flush_timer: Optional[threading.Timer] = None  # Pending trailing save
+        # orjson writes NaN/Infinity as null - stdlib json is kept for files holding them
+        self.__use_orjson = orjson is not None
         self.__load_skills()
     
     def add_technical_skill(self, name: str, category: str, difficulty: int) -> None:
@@ -445,6 +566,9 @@ class SkillForgeManager:
         
         skill = TechnicalSkill(name, category, difficulty)
         self.__skills.append(skill)
+        self.__index[name.lower()] = skill
+        self.__name_cache = None
+        self.__dirty = True
         print(f"✓ Technical skill '{name}' added successfully!")
     
     def add_soft_skill(self, name: str, category: str, applications: int = 0) -> None:
@@ -454,13 +578,28 @@ class SkillForgeManager:
         
         skill = SoftSkill(name, category, applications)
         self.__skills.append(skill)
+        self.__index[name.lower()] = skill
+        self.__name_cache = None
+        self.__dirty = True
         print(f"✓ Soft skill '{name}' added successfully!")
     
+    def delete_skill(self, name: str) -> None:
+        """Remove a skill from tracking"""
+        skill = self.__index.pop(name.lower(), None)
+        if skill:
+            self.__skills.remove(skill)
+            self.__name_cache = None
+            self.__dirty = True
+            print(f"✓ Skill '{skill.name}' deleted")
+        else:
+            raise ValueError(f"Skill '{name}' not found!")
+    
     def update_skill_progress(self, name: str, progress: float) -> None:
         """Update progress for a specific skill"""
         skill = self.__find_skill(name)
         if skill:
             skill.update_progress(progress)
+            self.__dirty = True
             print(f"✓ Progress updated for '{name}'")
         else:
             raise ValueError(f"Skill '{name}' not found!")
@@ -470,6 +609,7 @@ class SkillForgeManager:
         skill = self.__find_skill(name)
         if skill:
             skill.log_practice_hours(hours)
+            self.__dirty = True
             print(f"✓ Logged {hours} hours for '{name}'")
         else:
             raise ValueError(f"Skill '{name}' not found!")
@@ -477,8 +617,9 @@ class SkillForgeManager:
     def add_soft_skill_application(self, name: str) -> None:
         """Add real-world application for soft skill"""
         skill = self.__find_skill(name)
-        if skill and isinstance(skill, SoftSkill):
+        if type(skill) is SoftSkill:
             skill.add_real_world_application()
+            self.__dirty = True
             print(f"✓ Application logged for '{name}'")
         elif skill:
             raise TypeError(f"'{name}' is not a soft skill!")
@@ -495,12 +636,11 @@ class SkillForgeManager:
         print("🎯 YOUR SKILL PORTFOLIO")
         print("="*70)
         
-        # Sort by mastery score
-        sorted_skills = sorted(
-            self.__skills,
-            key=lambda s: s.calculate_mastery_score(),
-            reverse=True
-        )
+        # Sort by mastery score (decorate-sort-undecorate; index keeps ties stable
+        # and avoids ever comparing skill objects)
+        decorated = [(-s.calculate_mastery_score(), i, s) for i, s in enumerate(self.__skills)]
+        decorated.sort()
+        sorted_skills = [t[2] for t in decorated]
         
         for idx, skill in enumerate(sorted_skills, 1):
             print(f"\n[{idx}] {skill}")
@@ -512,11 +652,20 @@ class SkillForgeManager:
             print("\n📊 No statistics available yet.")
             return
         
+        # Single pass over the skills; both classes are leaves, so an exact
+        # type check is enough
+        tech_skills = soft_skills = 0
+        mastery_sum = total_hours = 0.0
+        for s in self.__skills:
+            if type(s) is TechnicalSkill:
+                tech_skills += 1
+            elif type(s) is SoftSkill:
+                soft_skills += 1
+            mastery_sum += s.calculate_mastery_score()
+            total_hours += s.practice_hours
+        
         total_skills = len(self.__skills)
-        tech_skills = sum(1 for s in self.__skills if isinstance(s, TechnicalSkill))
-        soft_skills = sum(1 for s in self.__skills if isinstance(s, SoftSkill))
-        avg_mastery = sum(s.calculate_mastery_score() for s in self.__skills) / total_skills
-        total_hours = sum(s.practice_hours for s in self.__skills)
+        avg_mastery = mastery_sum / total_skills
         
         print("\n" + "="*70)
         print("📊 SKILLFORGE STATISTICS")
@@ -528,74 +677,135 @@ class SkillForgeManager:
         print(f"Total Practice Hours: {total_hours:.1f}h")
         print("="*70)
     
-    def save_skills(self) -> None:
-        """Save all skills to file"""
+    def save_skills(self, pretty: bool = False) -> None:
+        """Save all skills to file (compact JSON unless pretty is requested)"""
+        with self.__flush_lock:
+            self.__write_skills(pretty)
+    
+    def __write_skills(self, pretty: bool) -> None:
+        """Serialize and write the storage file (private method)"""
         try:
             data = {
                 'skills': [skill.to_dict() for skill in self.__skills],
-                'last_saved': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                'last_saved': _now_str()
             }
             
-            with open(self.__storage_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            if self.__use_orjson:
+                option = orjson.OPT_INDENT_2 if pretty else 0
+                with open(self.__storage_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=option))
+            else:
+                with open(self.__storage_file, 'w') as f:
+                    json.dump(data, f, indent=2 if pretty else None)
             
+            self.__dirty = False
+            self.__last_flush = time.monotonic()
             print(f"✓ Skills saved to '{self.__storage_file}'")
         except Exception as e:
             print(f"✗ Error saving skills: {e}")
     
+    def maybe_flush(self, min_interval: float = 5.0) -> None:
+        """
+        Save pending changes, at most once per min_interval seconds.
+        Changes made inside the interval are written by a background timer when it elapses.
+        """
+        with self.__flush_lock:
+            if not self.__dirty:
+                return
+            
+            wait = self.__last_flush + min_interval - time.monotonic()
+            if wait <= 0:
+                self.save_skills()
+            elif self.__flush_timer is None:
+                self.__flush_timer = threading.Timer(wait, self.__trailing_flush)
+                self.__flush_timer.daemon = True
+                self.__flush_timer.start()
+    
+    def force_flush(self) -> None:
+        """
+        Save pending changes immediately.
+        Entry points register this with atexit as a backstop for the flush timer.
+        """
+        with self.__flush_lock:
+            if self.__dirty:
+                self.save_skills()
+    
+    def __trailing_flush(self) -> None:
+        """Timer callback - write changes batched by maybe_flush (private method)"""
+        with self.__flush_lock:
+            self.__flush_timer = None
+            self.force_flush()
+    
     def __load_skills(self) -> None:
         """Load skills from file (private method)"""
         if not os.path.exists(self.__storage_file):
             return
         
         try:
-            with open(self.__storage_file, 'r') as f:
-                data = json.load(f)
+            streamed = False
+            if (ijson is not None and
+                    os.path.getsize(self.__storage_file) > self.STREAM_LOAD_MIN_BYTES):
+                # Large file - parse and rebuild one skill at a time
+                try:
+                    with open(self.__storage_file, 'rb') as f:
+                        for skill_data in ijson.items(f, 'skills.item', use_float=True):
+                            self.__add_loaded_skill(skill_data)
+                    streamed = True
+                except ijson.JSONError:
+                    # ijson rejects NaN/Infinity - drop the partial load and retry below
+                    self.__skills.clear()
+                    self.__index.clear()
             
-            for skill_data in data.get('skills', []):
-                skill_type = skill_data.get('skill_type')
-                
-                if skill_type == "Technical Skill":
-                    skill = TechnicalSkill(
-                        skill_data['name'],
-                        skill_data['category'],
-                        skill_data.get('difficulty_level', 5)
-                    )
-                elif skill_type == "Soft Skill":
-                    skill = SoftSkill(
-                        skill_data['name'],
-                        skill_data['category'],
-                        skill_data.get('real_world_applications', 0)
-                    )
+            if not streamed:
+                if orjson is not None:
+                    with open(self.__storage_file, 'rb') as f:
+                        raw = f.read()
+                    try:
+                        data = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        # Older saves may contain NaN/Infinity, which only stdlib json accepts
+                        data = json.loads(raw)
+                        self.__use_orjson = False
                 else:
-                    continue
-                
-                skill._progress = skill_data['progress']
-                skill._practice_hours = skill_data['practice_hours']
-                skill._created_at = skill_data['created_at']
-                skill._last_updated = skill_data['last_updated']
-                skill._history = skill_data.get('history', [])  # Load history if available
+                    with open(self.__storage_file, 'r') as f:
+                        data = json.load(f)
                 
-                self.__skills.append(skill)
+                for skill_data in data.get('skills', []):
+                    self.__add_loaded_skill(skill_data)
+            
+            self.__name_cache = None
             
             print(f"✓ Loaded {len(self.__skills)} skills from storage")
         except Exception as e:
             print(f"⚠ Could not load previous data: {e}")
     
+    def __add_loaded_skill(self, skill_data: Dict) -> None:
+        """Rebuild one stored skill and start tracking it (private method)"""
+        skill_type = skill_data.get('skill_type')
+        
+        if skill_type == TechnicalSkill._SKILL_TYPE:
+            skill = TechnicalSkill._from_dict(skill_data)
+        elif skill_type == SoftSkill._SKILL_TYPE:
+            skill = SoftSkill._from_dict(skill_data)
+        else:
+            return
+        
+        self.__skills.append(skill)
+        self.__index.setdefault(skill.name.lower(), skill)
+    
     def __skill_exists(self, name: str) -> bool:
         """Check if skill already exists (private method)"""
-        return any(skill.name.lower() == name.lower() for skill in self.__skills)
+        return name.lower() in self.__index
     
     def __find_skill(self, name: str) -> Optional[SkillBase]:
         """Find skill by name (private method)"""
-        for skill in self.__skills:
-            if skill.name.lower() == name.lower():
-                return skill
-        return None
+        return self.__index.get(name.lower())
     
     def list_skill_names(self) -> List[str]:
-        """Return list of all skill names"""
-        return [skill.name for skill in self.__skills]
+        """Return list of all skill names (shared cached list - do not modify)"""
+        if self.__name_cache is None:
+            self.__name_cache = [skill.name for skill in self.__skills]
+        return self.__name_cache
     
     def view_skill_history(self, name: str) -> None:
         """Display detailed history for a specific skill"""
@@ -706,7 +916,7 @@ class SkillForgeManager:
             )
             balanced = MasteryAlgorithm.balanced_composite(
                 skill.progress, skill.practice_hours, 
-                min((applications / 20) * 100, 100)
+                min(applications * 5.0, 100.0)
             )
             
             print(f"  Linear Weighted:        {linear:>6.2f}/100")
@@ -733,6 +943,20 @@ class SkillForgeUI:
     
     def __init__(self):
         self.manager = SkillForgeManager()
+        atexit.register(self.manager.force_flush)  # Persist pending changes on exit
+        
+        # Menu choice -> handler (option 10, save & exit, is handled by run())
+        self._dispatch = {
+            '1': self.add_technical_skill_flow,
+            '2': self.add_soft_skill_flow,
+            '3': self.update_progress_flow,
+            '4': self.log_hours_flow,
+            '5': self.log_application_flow,
+            '6': self.manager.display_all_skills,
+            '7': self.manager.get_statistics,
+            '8': self.view_history_flow,
+            '9': self.view_mastery_breakdown_flow
+        }
     
     def display_menu(self) -> None:
         """Display main menu"""
@@ -896,27 +1120,12 @@ class SkillForgeUI:
             try:
                 self.display_menu()
                 choice = self.get_choice()
+                handler = self._dispatch.get(choice)
                 
-                if choice == '1':
-                    self.add_technical_skill_flow()
-                elif choice == '2':
-                    self.add_soft_skill_flow()
-                elif choice == '3':
-                    self.update_progress_flow()
-                elif choice == '4':
-                    self.log_hours_flow()
-                elif choice == '5':
-                    self.log_application_flow()
-                elif choice == '6':
-                    self.manager.display_all_skills()
-                elif choice == '7':
-                    self.manager.get_statistics()
-                elif choice == '8':
-                    self.view_history_flow()
-                elif choice == '9':
-                    self.view_mastery_breakdown_flow()
+                if handler:
+                    handler()
                 elif choice == '10':
-                    self.manager.save_skills()
+                    self.manager.force_flush()
                     print("\n👋 Thank you for using SkillForge! Keep growing!")
                     break
                 else:
@@ -924,7 +1133,7 @@ class SkillForgeUI:
             
             except KeyboardInterrupt:
                 print("\n\n⚠ Interrupted! Saving your progress...")
-                self.manager.save_skills()
+                self.manager.force_flush()
                 print("👋 Goodbye!")
                 break
             except Exception as e:
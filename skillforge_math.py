@@ -0,0 +1,94 @@
+"""
+SkillForge - Hybrid mastery formulas
+Single source of the TechnicalSkill/SoftSkill mastery scores, usable as plain
+Python or as an optional ahead-of-time compiled module.
+
+Usage (requires numba):
+    python skillforge_math.py
+
+This writes a `_skillforge_math` extension next to this file. load_formulas()
+uses it when its FORMULA_VERSION matches and falls back to the Python
+functions below otherwise, so no JIT warm-up is paid at runtime.
+
+Note: numba.pycc is deprecated upstream and may be removed in a future numba
+release; the Python functions remain the reference implementation.
+"""
+
+import math
+import os
+from typing import Callable, Tuple
+
+# Bump whenever tech_mastery/soft_mastery change - older native builds are then ignored
+FORMULA_VERSION = 1
+
+
+# ============================================================================
+# SCALAR MASTERY FORMULAS
+# ============================================================================
+
+def tech_mastery(progress: float, hours: float, difficulty: float) -> float:
+    """
+    Hybrid technical mastery score.
+    Mirrors TechnicalSkill: difficulty_adjusted × 0.85 + exponential_growth(0.15) × 0.15
+    """
+    primary = min((progress * 0.5 + min(hours, 100.0) * 0.3) * (1.0 + difficulty / 10.0 * 0.2), 100.0)
+    if hours == 0.0:
+        growth = progress * 0.5 * 0.15
+    else:
+        growth = min(progress * (1.0 + math.log(1.0 + hours / 10.0)) * 0.15, 100.0)
+    return min(primary * 0.85 + growth * 0.15, 100.0)
+
+
+def soft_mastery(progress: float, hours: float, applications: float) -> float:
+    """
+    Hybrid soft skill mastery score.
+    Mirrors SoftSkill: application_focused × 0.75 + sigmoid_curve(0.08) × 0.25
+    """
+    primary = min(progress * 0.35 + min(hours * 2.0, 100.0) * 0.25
+                  + min(applications * 5.0, 100.0) * 0.4, 100.0)
+    combined = (progress + min(hours, 100.0)) / 2.0
+    sigmoid = 100.0 / (1.0 + math.exp(-0.08 * (combined - 50.0)))
+    return min(primary * 0.75 + sigmoid * 0.25, 100.0)
+
+
+def formula_version() -> int:
+    """Return the formula revision (compiled into the native build as a constant)"""
+    return FORMULA_VERSION
+
+
+def load_formulas() -> Tuple[Callable[[float, float, float], float],
+                             Callable[[float, float, float], float]]:
+    """Return (tech_mastery, soft_mastery), native when an up-to-date build is importable"""
+    try:
+        import _skillforge_math as native
+    except ImportError:
+        return tech_mastery, soft_mastery
+    
+    version = getattr(native, 'formula_version', None)
+    if version is None or version() != FORMULA_VERSION:
+        print("⚠ _skillforge_math is out of date - rerun `python skillforge_math.py`; "
+              "using Python formulas")
+        return tech_mastery, soft_mastery
+    
+    return native.tech_mastery, native.soft_mastery
+
+
+# ============================================================================
+# AOT BUILD ENTRY POINT
+# ============================================================================
+
+def build() -> None:
+    """Compile the formulas into the _skillforge_math extension module"""
+    from numba.pycc import CC
+
+    cc = CC('_skillforge_math')
+    cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+    cc.export('tech_mastery', 'f8(f8, f8, f8)')(tech_mastery)
+    cc.export('soft_mastery', 'f8(f8, f8, f8)')(soft_mastery)
+    cc.export('formula_version', 'i8()')(formula_version)
+    cc.compile()
+    print(f"✓ Built _skillforge_math in '{cc.output_dir}'")
+
+
+if __name__ == "__main__":
+    build()